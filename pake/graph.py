@@ -27,6 +27,8 @@ class Graph:
     Represents a node in a directed graph.
     """
 
+    __slots__ = ('_edges',)
+
     def __init__(self):
         self._edges = set()
 
@@ -57,29 +59,55 @@ class Graph:
         """
         return self._edges
 
-    @staticmethod
-    def _topological_sort(vertex, visited):
-        visited.add(vertex)
-
-        for i in vertex.edges:
-            if i not in visited:
-                yield from Graph._topological_sort(i, visited)
-
-        yield vertex
-
-    def topological_sort(self):
+    def topological_sort(self, visited=None):
         """
         Return a generator object that runs topological sort as it is iterated over.
 
         Nodes that have been visited will not be revisited, making infinite recursion impossible.
 
+        Nodes are produced as soon as all of their edges have been produced, the sort
+        uses an explicit stack instead of recursion so the depth of the graph is not
+        limited by the interpreters recursion limit.
+
+        :param visited: Optional set of nodes which have already been produced, nodes in
+                        this set are skipped and produced nodes are added to it.  Passing the
+                        same set to the sorts of several nodes produces every node only once
+                        across all of them.
+
         :return: A generator that produces :py:class:`pake.graph.Graph` nodes.
         """
 
-        visited = {self}
+        if visited is None:
+            visited = set()
+        elif self in visited:
+            return
+
+        visited.add(self)
+
+        if not self.edges:
+            # Nothing to sort
+            yield self
+            return
+
+        # Each stack entry is a node, and an iterator
+        # over the edges of that node still left to visit
+
+        stack = [(self, iter(self.edges))]
+
+        while stack:
+            vertex, edges = stack[-1]
+
+            for i in edges:
+                if i not in visited:
+                    visited.add(i)
 
-        for i in self.edges:
-            if i not in visited:
-                yield from self._topological_sort(i, visited)
+                    if i.edges:
+                        stack.append((i, iter(i.edges)))
+                        break
 
-        yield self
+                    # Leaf nodes can be produced immediately,
+                    # they do not need to go on the stack
+                    yield i
+            else:
+                stack.pop()
+                yield vertex
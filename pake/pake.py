@@ -18,12 +18,17 @@
 # ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import heapq
 import inspect
+import io
+import itertools
+import queue
 import shutil
 import subprocess
 import tempfile
 import threading
 import traceback
+from collections import OrderedDict
 from functools import wraps
 from glob import iglob as glob_iglob
 from contextlib import contextmanager
@@ -40,9 +45,7 @@ import pake.returncodes
 from concurrent.futures import \
     ThreadPoolExecutor, \
     wait as futures_wait, \
-    Executor, Future
-
-from os import path
+    Executor, Future, FIRST_COMPLETED
 
 from pake.process import StreamingSubprocessException
 
@@ -223,10 +226,107 @@ def _handle_task_exception(ctx, exception):
     raise TaskException(ctx.name, exception)
 
 
+# Characters of output kept in memory by a task output buffer
+# before its contents are moved into a temporary file
+_OUTPUT_BUFFER_SPILL_SIZE = 1024 * 1024
+
+
+class _TaskOutputBuffer(io.TextIOBase):
+    # Text stream used for TaskContext.io when task output is synchronized.
+    #
+    # Output is kept in memory until something asks for a real file descriptor,
+    # IE. when the stream is passed as the stdout of a subprocess.  At that point
+    # the buffered text is moved into a temporary file which is used from then on.
+    #
+    # If spill_size is given, the text is also moved into a temporary file once
+    # more than spill_size characters have been written to the stream.
+    #
+    # Several threads of a multitask context can write to the same task
+    # output at once without holding the task IO lock, so access to the
+    # underlying buffer is locked internally.  Otherwise a write could go
+    # to the old buffer while it is being moved into the temporary file.
+
+    def __init__(self, spill_size=None):
+        super().__init__()
+        self._buffer = io.StringIO(newline='\n')
+        self._spilled = False
+        self._spill_size = spill_size
+        self._lock = threading.Lock()
+
+    def _spill(self):
+        # Only called with self._lock held
+        temp_file = tempfile.TemporaryFile(mode='w+', newline='\n')
+        temp_file.write(self._buffer.getvalue())
+        self._buffer.close()
+        self._buffer = temp_file
+        self._spilled = True
+
+    def fileno(self):
+        with self._lock:
+            if not self._spilled:
+                self._spill()
+
+            # Anything written before the subprocess starts
+            # must reach the file before the subprocess writes
+            self._buffer.flush()
+            return self._buffer.fileno()
+
+    def writable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def write(self, text):
+        with self._lock:
+            written = self._buffer.write(text)
+
+            if not self._spilled and self._spill_size is not None \
+                    and self._buffer.tell() > self._spill_size:
+                self._spill()
+
+            return written
+
+    def flush(self):
+        with self._lock:
+            self._buffer.flush()
+
+    def read(self, size=-1):
+        with self._lock:
+            return self._buffer.read(size)
+
+    def readline(self, size=-1):
+        with self._lock:
+            return self._buffer.readline(size)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        with self._lock:
+            return self._buffer.seek(offset, whence)
+
+    def tell(self):
+        with self._lock:
+            return self._buffer.tell()
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            with self._lock:
+                self._buffer.close()
+
+
 def _wait_futures_and_raise(futures):
-    futures_wait(futures)
-    for i in futures:
-        err = i.exception()
+    # Future.exception blocks until the future is done, waiting on each
+    # future in turn avoids concurrent.futures.wait installing a waiter
+    # on (and locking) every future at once.  Everything is waited on
+    # before the first exception in submission order is raised.
+
+    errors = [i.exception() for i in futures]
+
+    for err in errors:
         if err:
             raise err
 
@@ -275,7 +375,6 @@ class TaskContext:
 
         self._pake = pake_obj
         self._node = node
-        self._future = None
         self._io = None
         self._io_lock = threading.RLock()
         self.inputs = []
@@ -293,8 +392,9 @@ class TaskContext:
 
         Otherwise, it will acquire a lock for :py:attr:`pake.TaskContext.io` that
         exists inside of the task context, since the task will be buffering output
-        to an individual temporary file when :py:attr:`pake.Pake.max_jobs` is greater
-        than **1**.
+        in an individual output buffer when :py:attr:`pake.Pake.max_jobs` is greater
+        than **1**.  The buffer is kept in memory, and is moved to a temporary file when
+        its **fileno()** is requested or when the task writes a large amount of output.
 
         If :py:attr:`pake.Pake.sync_output` is **False**, the context manager
         returned by this property will not attempt to acquire any lock.
@@ -302,19 +402,11 @@ class TaskContext:
         :return: A context manager object that can be used in a **with** statement.
         """
 
-        if self.pake.max_jobs > 1:
-            # Lock the task IO queue, since that
-            # is what is being written to
-            output_lock = self._io_lock
-        else:
-            # Lock the pake instances stdout, since
-            # we are writing directly to it if
-            # multiple jobs are not running
-            output_lock = self.pake._stdout_lock
+        output_lock = self._get_io_lock()
 
         @contextmanager
         def context():
-            if self.pake.sync_output:
+            if output_lock is not None:
                 with output_lock:
                     yield
             else:
@@ -322,6 +414,23 @@ class TaskContext:
 
         return context()
 
+    def _get_io_lock(self):
+        # Returns the lock which guards self._io, or None
+        # if output synchronization is disabled
+
+        if not self.pake.sync_output:
+            return None
+
+        if self.pake.max_jobs > 1:
+            # Lock the task IO queue, since that
+            # is what is being written to
+            return self._io_lock
+
+        # Lock the pake instances stdout, since
+        # we are writing directly to it if
+        # multiple jobs are not running
+        return self.pake._stdout_lock
+
     def multitask(self, aggregate_exceptions=False):
         """
         Returns a contextual object for submitting work to pake's current thread pool.
@@ -422,12 +531,14 @@ class TaskContext:
         This file object is a text mode stream, it can be used with the built in **print** function
         and other methods that can write text data to a file like object.
 
-        When you run pake with more than one job, this will be a reference to a temporary file unless
+        When you run pake with more than one job, this will be a reference to an output buffer unless
         :py:attr:`pake.Pake.sync_output` is **False** (It is **False** when **--no-sync-output** is used on the command line).
 
-        The temporary file queues up task output when in use, and the task context acquires a lock
-        and writes it incrementally to :py:attr:`pake.Pake.stdout` when the task finishes. This is
-        done to avoid having concurrent task's writing interleaved output to :py:attr:`pake.Pake.stdout`.
+        The buffer queues up task output in memory when in use, and it is written to :py:attr:`pake.Pake.stdout`
+        all at once when the task finishes. This is done to avoid having concurrent task's writing interleaved
+        output to :py:attr:`pake.Pake.stdout`.  If something requests the buffer's **fileno()**, for instance
+        when it is passed as the **stdout** of a subprocess, or the task writes a large amount of output,
+        its contents are moved to a temporary file which is used for the rest of the task.
 
         If you run pake with only 1 job or :py:attr:`pake.Pake.sync_output` is **False**, this
         property will return a direct reference to :py:attr:`pake.Pake.stdout`.
@@ -441,8 +552,37 @@ class TaskContext:
         """
         kwargs.pop('file', None)
 
-        with self.io_lock:
-            print(*args, file=self._io, **kwargs)
+        flush = kwargs.pop('flush', False)
+
+        # Render the text before taking the lock, so that the
+        # lock is only held for a single write to the task IO
+        # stream instead of one write per argument and separator
+
+        if kwargs:
+            text = io.StringIO()
+            print(*args, file=text, **kwargs)
+            text = text.getvalue()
+        else:
+            # Default sep and end, same result as the builtin print
+            text = ' '.join(map(str, args)) + '\n'
+
+        self._i_write(text, flush=flush)
+
+    def _i_write(self, text, flush=False):
+        # Write already rendered text to the task IO
+        # stream as a single write, under the IO lock
+
+        output_lock = self._get_io_lock()
+
+        if output_lock is None:
+            self._io.write(text)
+            if flush:
+                self._io.flush()
+        else:
+            with output_lock:
+                self._io.write(text)
+                if flush:
+                    self._io.flush()
 
     def subpake(self, *args, silent=False, ignore_errors=False, collect_output=False):
         """
@@ -713,57 +853,71 @@ class TaskContext:
                                       collect_output=collect_output)
 
     def _call_with_errors(self, args, stdin, shell, silent, print_cmd, collect_output):
-        with subprocess.Popen(args,
-                              stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT,
-                              stdin=stdin, shell=shell,
-                              universal_newlines=True) as process:
+        # Live output needs to go to self._io and output_copy_buffer at once,
+        # so it is copied through a pipe.  Otherwise output_copy_buffer is only
+        # needed for error reporting when silent = True, and incremental write
+        # when collect_output = True, and the process can write into it directly
+
+        tee_output = not silent and not collect_output
 
-            output_copy_buffer = tempfile.TemporaryFile(mode='w+', newline='\n')
+        if tee_output:
+            # The copy is usually small and thrown away, keep
+            # it in memory unless the process is very chatty
+            output_copy_buffer = _TaskOutputBuffer(spill_size=_OUTPUT_BUFFER_SPILL_SIZE)
+        else:
+            # The process writes raw output into this file, so newline
+            # translation is left on, like the universal newlines pipe
+            # in the live output path
+            output_copy_buffer = tempfile.TemporaryFile(mode='w+')
+
+        def do_collect_output(seek0_before, seek0_after):
+            if seek0_before:
+                output_copy_buffer.seek(0)
 
-            def do_collect_output(seek0_before, seek0_after):
-                if seek0_before:
+            if collect_output and not silent:
+                with self.io_lock:
+                    shutil.copyfileobj(output_copy_buffer, self._io)
+
+                if seek0_after:
                     output_copy_buffer.seek(0)
 
-                if collect_output and not silent:
-                    with self.io_lock:
-                        shutil.copyfileobj(output_copy_buffer, self._io)
+        if collect_output and print_cmd:
+            output_copy_buffer.write(' '.join(args) + '\n')
+        elif print_cmd:
+            self._i_write(' '.join(args) + '\n')
 
-                    if seek0_after:
-                        output_copy_buffer.seek(0)
+        if tee_output:
+            p_stdout = subprocess.PIPE
+        else:
+            output_copy_buffer.flush()
+            p_stdout = output_copy_buffer
 
-            try:
-                if not silent and not collect_output:
+        try:
+            process = subprocess.Popen(args,
+                                       stdout=p_stdout,
+                                       stderr=subprocess.STDOUT,
+                                       stdin=stdin, shell=shell,
+                                       universal_newlines=True)
+        except:
+            output_copy_buffer.close()
+            raise
+
+        with process:
+            if tee_output:
+                try:
                     # Use readline for live output to self._io when max jobs == 1
                     # The task is on the current thread, and self._io is a direct
                     # unbuffered reference this.stdout.  Otherwise copy fix sized
                     # chunks of data until EOF
 
-                    if print_cmd:
-                        self.print(' '.join(args))
-
                     pake.util.copyfileobj_tee(process.stdout,
                                               [self._io, output_copy_buffer],
                                               readline=self.pake.max_jobs == 1)
-                else:
-
-                    # Only need to copy to the output_copy_buffer, for error
-                    # reporting when silent = True, and incremental write
-                    # when collect_output = True
-
-                    if collect_output and print_cmd:
-                        output_copy_buffer.write(' '.join(args) + '\n')
-                    elif print_cmd:
-                        self.print(' '.join(args))
-
-                    shutil.copyfileobj(process.stdout, output_copy_buffer)
-
-            except:  # pragma: no cover
-                do_collect_output(seek0_before=True, seek0_after=False)
-                output_copy_buffer.close()
-                raise
-            finally:
-                process.stdout.close()
+                except:  # pragma: no cover
+                    output_copy_buffer.close()
+                    raise
+                finally:
+                    process.stdout.close()
 
             try:
                 exitcode = process.wait()
@@ -799,12 +953,21 @@ class TaskContext:
 
         else:
             if print_cmd:
-                self.print(' '.join(args))
+                self._i_write(' '.join(args) + '\n')
             if silent:
                 p_stdout = subprocess.DEVNULL
+            elif type(self._io) is _TaskOutputBuffer:
+                # Copy the output through a pipe, handing the task output
+                # buffer to the process would move it into a temporary file
+                return self._call_into_io(args, stdin=stdin, shell=shell)
             else:
                 p_stdout = self._io
 
+        if p_stdout is not subprocess.DEVNULL:
+            # The process writes straight to the file descriptor,
+            # text buffered on the Python side has to go first
+            p_stdout.flush()
+
         try:
             return subprocess.call(args,
                                    stdout=p_stdout,
@@ -822,6 +985,20 @@ class TaskContext:
 
                 p_stdout.close()
 
+    def _call_into_io(self, args, stdin, shell):
+        with subprocess.Popen(args,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT,
+                              stdin=stdin, shell=shell,
+                              universal_newlines=True) as process:
+            try:
+                shutil.copyfileobj(process.stdout, self._io)
+            except:  # pragma: no cover
+                process.kill()
+                raise
+
+            return process.wait()
+
     @property
     def dependencies(self):
         """
@@ -834,9 +1011,9 @@ class TaskContext:
         
         This property **will** return a meaningful value outside of a task.
         """
-        return list(
-            self.pake.get_task_context(i.func) for i in self._node.edges
-        )
+        task_contexts = self.pake._task_contexts
+
+        return [task_contexts[i.name] for i in self._node.edges]
 
     @property
     def dependency_outputs(self):
@@ -849,36 +1026,29 @@ class TaskContext:
         Not available outside of a task, may only be used while a task is executing.
         """
 
+        # Outputs are already flattened when the task runs, and the dependency
+        # nodes know their task names, so look the contexts up by name directly
+        # instead of building the intermediate context list in self.dependencies
+
+        task_contexts = self.pake._task_contexts
+
         return list(
-            pake.util.flatten_non_str(
-                self.pake.get_task_context(i.func).outputs for i in self.dependencies
+            itertools.chain.from_iterable(
+                task_contexts[i.name].outputs for i in self._node.edges
             )
         )
 
     def _i_io_open(self):
         if self._pake.threadpool and self.pake.sync_output:
-            self._io = tempfile.TemporaryFile(mode='w+', newline='\n')
+            self._io = _TaskOutputBuffer(spill_size=_OUTPUT_BUFFER_SPILL_SIZE)
         else:
             self._io = self.pake.stdout
 
     def _i_io_close(self):
         if self.pake.threadpool and self.pake.sync_output:
-            self._io.seek(0)
-            with self.pake._stdout_lock:
-                shutil.copyfileobj(self._io, self.pake.stdout)
-            self._io.close()
-
-    def _i_submit_self(self):
-
-        futures = [self.pake.get_task_context(i.name)._future for i in self._node.edges]
-
-        # Wait dependencies, Raise pending exceptions
-        _wait_futures_and_raise(futures)
-
-        # Submit self
-        self._future = self._pake.threadpool.submit(self._node.func)
-
-        return self._future
+            # The pake instance takes ownership of the
+            # buffer and closes it once it has been written
+            self.pake._write_task_output(self._io)
 
     @property
     def node(self):
@@ -1044,8 +1214,8 @@ def pattern(file_pattern):
 
     def output_generator(inputs):
         for inp in inputs:
-            dirname = os.path.dirname(inp)
-            name, ext = os.path.splitext(os.path.basename(inp))
+            dirname, basename = os.path.split(inp)
+            name, ext = os.path.splitext(basename)
             yield file_pattern.replace('{dir}', dirname).replace('%', name).replace('{ext}', ext)
 
     return output_generator
@@ -1303,6 +1473,12 @@ class Pake:
         self._run_count = 0
         self._cur_max_jobs = 1
 
+        # Finished task output is handed to a dedicated
+        # writer thread while running with multiple jobs
+        self._task_output_queue = None
+        self._task_output_thread = None
+        self._task_output_errors = None
+
     @property
     def max_jobs(self):
         """Returns the value of the **jobs** parameter used in the last invocation of :py:meth:`pake.Pake.run`.
@@ -1446,26 +1622,41 @@ class Pake:
 
         if i is None:
             i = []
+        elif type(i) is str:
+            i = [i]
         elif callable(i):
-            i = i()
-        elif type(i) is str or not pake.util.is_iterable_not_str(i):
+            i = Pake._flatten_i_o(i())
+        elif not pake.util.is_iterable_not_str(i):
             i = [i]
         else:
-            i = map(lambda inp: inp() if callable(inp) else inp, i)
-
-        i = list(pake.util.flatten_non_str(i))
+            i = Pake._flatten_i_o([inp() if callable(inp) else inp for inp in i])
 
         if o is None:
             o = []
-        if callable(o):
-            o = o(list(i))
-        elif type(o) is str or not pake.util.is_iterable_not_str(o):
+        elif type(o) is str:
             o = [o]
-
-        o = list(pake.util.flatten_non_str(o))
+        elif callable(o):
+            o = Pake._flatten_i_o(o(list(i)))
+        elif not pake.util.is_iterable_not_str(o):
+            o = [o]
+        else:
+            o = Pake._flatten_i_o(o)
 
         return i, o
 
+    @staticmethod
+    def _flatten_i_o(values):
+        # Most input and output lists are already flat lists of
+        # strings, only run the recursive flatten when they are not
+
+        values = list(values)
+
+        for value in values:
+            if type(value) is not str:
+                return list(pake.util.flatten_non_str(values))
+
+        return values
+
     def _increment_run_count(self):
         if self._cur_max_jobs > 1:
             with self._run_count_lock:
@@ -1481,31 +1672,72 @@ class Pake:
         if len_i > 0 and len_o == 0:
             raise MissingOutputsException(task_name)
 
+        if len_o == 0:
+            return [], []
+
+        # Pick the routine specialized for the shape of the
+        # inputs and outputs once, so that none of them need
+        # to branch on lengths while iterating over files
+
+        if len_i == 0:
+            detect = Pake._change_detect_outputs_only
+        elif len_o == 1:
+            detect = Pake._change_detect_single_output
+        elif len_o == len_i:
+            detect = Pake._change_detect_paired
+        else:
+            detect = Pake._change_detect_multiple_outputs
+
         outdated_inputs = []
         outdated_outputs = []
 
-        if len_i == 0 and len_o == 0:
-            return [], []
+        # Files are only looked up on disk once per change
+        # detection pass, even when the same path is compared
+        # against many other paths
 
-        if len_o > 1:
-            Pake._change_detect_multiple_outputs(task_name, i, o,
-                                                 outdated_inputs,
-                                                 outdated_outputs)
+        stat_cache = dict()
 
-        else:
-            Pake._change_detect_single_output(task_name, i, o,
-                                              outdated_inputs,
-                                              outdated_outputs)
+        detect(task_name, i, o, stat_cache, outdated_inputs, outdated_outputs)
 
         return outdated_inputs, outdated_outputs
 
     @staticmethod
-    def _change_detect_single_output(task_name, i, o, outdated_inputs, outdated_outputs):
+    def _mtime_cached(stat_cache, file_path):
+        # Returns the modification time in nanoseconds,
+        # or None if the file/directory does not exist
+
+        try:
+            return stat_cache[file_path]
+        except KeyError:
+            pass
+
+        # A single stat call answers both whether the
+        # path exists and what its modification time is
+
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except (OSError, ValueError):
+            # Same conditions os.path.exists treats as non existent
+            mtime = None
+
+        stat_cache[file_path] = mtime
+        return mtime
+
+    @staticmethod
+    def _change_detect_outputs_only(task_name, i, o, stat_cache, outdated_inputs, outdated_outputs):
+        for output_object in o:
+            if Pake._mtime_cached(stat_cache, output_object) is None:
+                outdated_outputs.append(output_object)
+
+    @staticmethod
+    def _change_detect_single_output(task_name, i, o, stat_cache, outdated_inputs, outdated_outputs):
         output_object = o[0]
 
-        if not path.exists(output_object):
+        output_mtime = Pake._mtime_cached(stat_cache, output_object)
+
+        if output_mtime is None:
             for input_object in i:
-                if not path.exists(input_object):
+                if Pake._mtime_cached(stat_cache, input_object) is None:
                     raise InputNotFoundException(task_name, input_object)
 
             outdated_outputs.append(output_object)
@@ -1513,9 +1745,10 @@ class Pake:
         else:
             outdated_output = None
             for input_object in i:
-                if not path.exists(input_object):
+                input_mtime = Pake._mtime_cached(stat_cache, input_object)
+                if input_mtime is None:
                     raise InputNotFoundException(task_name, input_object)
-                if pake.util.is_more_recent(input_object, output_object):
+                if input_mtime > output_mtime:
                     outdated_inputs.append(input_object)
                     outdated_output = output_object
 
@@ -1523,37 +1756,53 @@ class Pake:
                 outdated_outputs.append(outdated_output)
 
     @staticmethod
-    def _change_detect_multiple_outputs(task_name, i, o, outdated_inputs, outdated_outputs):
-        len_i = len(i)
-        len_o = len(o)
+    def _change_detect_paired(task_name, i, o, stat_cache, outdated_inputs, outdated_outputs):
+        for input_object, output_object in zip(i, o):
+            input_mtime = Pake._mtime_cached(stat_cache, input_object)
+            if input_mtime is None:
+                raise InputNotFoundException(task_name, input_object)
 
-        if len_i == 0:
-            for output_object in o:
-                if not path.exists(output_object):
-                    outdated_outputs.append(output_object)
+            output_mtime = Pake._mtime_cached(stat_cache, output_object)
+            if output_mtime is None or input_mtime > output_mtime:
+                outdated_inputs.append(input_object)
+                outdated_outputs.append(output_object)
 
-        elif len_o != len_i:
-            output_set = set()
-            input_set = set()
+    @staticmethod
+    def _change_detect_multiple_outputs(task_name, i, o, stat_cache, outdated_inputs, outdated_outputs):
+        # Every input is checked against every output
+        # when the amount of inputs and outputs differ.
+        #
+        # An input is out of date if any output is missing or older than it,
+        # and an output is out of date if it is missing or any input is newer.
+        # Comparing against the oldest output and the newest input gives the
+        # same result as comparing every pair.
+
+        input_mtimes = []
+        for input_object in i:
+            input_mtime = Pake._mtime_cached(stat_cache, input_object)
+            if input_mtime is None:
+                raise InputNotFoundException(task_name, input_object)
+            input_mtimes.append(input_mtime)
+
+        output_mtimes = [Pake._mtime_cached(stat_cache, output_object) for output_object in o]
+
+        newest_input = max(input_mtimes)
+
+        if None in output_mtimes:
+            oldest_output = None
+        else:
+            oldest_output = min(output_mtimes)
 
-            for input_object in i:
-                if not path.exists(input_object):
-                    raise InputNotFoundException(task_name, input_object)
-                for output_object in o:
-                    if not path.exists(output_object) or pake.util.is_more_recent(input_object, output_object):
-                        input_set.add(input_object)
-                        output_set.add(output_object)
+        # OrderedDict.fromkeys removes duplicates while keeping the given order,
+        # plain dicts do not keep insertion order before Python 3.7
 
-            outdated_inputs += input_set
-            outdated_outputs += output_set
+        outdated_inputs += OrderedDict.fromkeys(
+            input_object for input_object, input_mtime in zip(i, input_mtimes)
+            if oldest_output is None or input_mtime > oldest_output)
 
-        else:
-            for input_object, output_object in zip(i, o):
-                if not path.exists(input_object):
-                    raise InputNotFoundException(task_name, input_object)
-                if not path.exists(output_object) or pake.util.is_more_recent(input_object, output_object):
-                    outdated_inputs.append(input_object)
-                    outdated_outputs.append(output_object)
+        outdated_outputs += OrderedDict.fromkeys(
+            output_object for output_object, output_mtime in zip(o, output_mtimes)
+            if output_mtime is None or newest_input > output_mtime)
 
     def task(self, *args, i=None, o=None, show_header=None):
         """
@@ -1739,7 +1988,7 @@ class Pake:
                 return func
 
         if len(args) == 1 and pake.util.is_iterable_not_str(args[0]):
-            dependencies = list(args[0])
+            dependencies = tuple(args[0])
         else:
             dependencies = args
 
@@ -1809,27 +2058,33 @@ class Pake:
         :return: :py:class:`pake.TaskContext`
         """
 
+        if type(task) is str:
+            # Avoid looking the name up twice, once to validate
+            # it in self.get_task_name and again to fetch the context
+            ctx = self._task_contexts.get(task, None)
+            if ctx is None:
+                raise UndefinedTaskException(task)
+            return ctx
+
         # self.get_task_name will raise if the task is undefined
 
-        return self._task_contexts.get(self.get_task_name(task))
+        return self._task_contexts[self.get_task_name(task)]
 
     @staticmethod
     def _should_run_task(ctx, inputs, outputs):
-        if inputs is None and outputs is None:
-            return True
-
         i, o = Pake._process_i_o_params(inputs, outputs)
         outdated_inputs, outdated_outputs = Pake._change_detect(ctx.name, i, o)
 
-        ctx.inputs = list(i)
-        ctx.outputs = list(o)
-        ctx.outdated_inputs = list(outdated_inputs)
-        ctx.outdated_outputs = list(outdated_outputs)
+        # These are all fresh lists owned by this call,
+        # so they can be handed to the context without copying
 
-        if (len(i) > 0 or len(o) > 0) and (len(outdated_inputs) > 0 or len(outdated_outputs) > 0):
-            return True
+        ctx.inputs = i
+        ctx.outputs = o
+        ctx.outdated_inputs = outdated_inputs
+        ctx.outdated_outputs = outdated_outputs
 
-        return False
+        # Nothing can be out of date if there are no inputs or outputs
+        return len(outdated_inputs) > 0 or len(outdated_outputs) > 0
 
     def add_task(self, name, func, dependencies=None, inputs=None, outputs=None, show_header=None):
         """
@@ -1908,14 +2163,19 @@ class Pake:
         if name in self._task_contexts:
             raise RedefinedTaskException(name)
 
+        # Tasks without inputs or outputs always run, and
+        # can skip change detection altogether
+        detect_changes = inputs is not None or outputs is not None
+
         @wraps(func)
         def func_wrapper(*args, **kwargs):
-            ctx = self.get_task_context(func)
+            # task_context is assigned below, before the task can ever run
+            ctx = task_context
 
             try:
                 ctx._i_io_open()
 
-                if not Pake._should_run_task(ctx, inputs, outputs):
+                if detect_changes and not Pake._should_run_task(ctx, inputs, outputs):
                     return None
 
                 self._increment_run_count()
@@ -1962,22 +2222,21 @@ class Pake:
             # alias for the wrapped function (for internal usage)
             self._task_func_names[task_context.func] = name
 
-        if dependencies:
-            if pake.util.is_iterable_not_str(dependencies):
-                for dependency in dependencies:
-                    dep_task = self.get_task_context(dependency)
-                    task_context.node.add_edge(dep_task.node)
-                    try:
-                        self._graph.remove_edge(dep_task.node)
-                    except KeyError:
-                        pass
-            else:
-                dep_task = self.get_task_context(dependencies)
-                task_context.node.add_edge(dep_task.node)
-                try:
-                    self._graph.remove_edge(dep_task.node)
-                except KeyError:
-                    pass
+        # Normalize dependencies to a sequence once, a single task
+        # reference (by name or callable) becomes a one element tuple
+
+        if not dependencies:
+            dependencies = ()
+        elif not pake.util.is_iterable_not_str(dependencies):
+            dependencies = (dependencies,)
+
+        for dependency in dependencies:
+            dep_task = self.get_task_context(dependency)
+            task_context.node.add_edge(dep_task.node)
+            try:
+                self._graph.remove_edge(dep_task.node)
+            except KeyError:
+                pass
 
         self._graph.add_edge(task_context.node)
 
@@ -1987,6 +2246,9 @@ class Pake:
         """
         Run all given tasks, with an optional level of concurrency.
 
+        A task that is a dependency of more than one of the given tasks
+        (or is given itself as well) is only visited once per run.
+
         :raises: :py:exc:`ValueError` if **jobs** is less than 1,
                  or if **tasks** is **None** or an empty list.
         
@@ -2015,7 +2277,12 @@ class Pake:
         self._cur_max_jobs = jobs
         self._run_count = 0
 
-        task_graphs = (self.get_task_context(task).node.topological_sort() for task in tasks)
+        # Tasks shared between the requested tasks are only run once,
+        # the sort of each requested task skips everything already sorted
+
+        visited = set()
+
+        task_graphs = (self.get_task_context(task).node.topological_sort(visited) for task in tasks)
 
         if jobs == 1:
             self._run_sync(task_graphs)
@@ -2023,6 +2290,175 @@ class Pake:
 
         self._run_parallel(jobs, task_graphs)
 
+    def _write_task_output(self, task_io):
+        output_queue = self._task_output_queue
+
+        if output_queue is not None:
+            output_queue.put(task_io)
+        else:
+            self._copy_task_output(task_io)
+
+    def _copy_task_output(self, task_io):
+        try:
+            task_io.seek(0)
+            with self._stdout_lock:
+                shutil.copyfileobj(task_io, self.stdout)
+        finally:
+            task_io.close()
+
+    def _task_output_writer(self, output_queue, errors):
+        while True:
+            task_io = output_queue.get()
+
+            if task_io is None:
+                return
+
+            try:
+                self._copy_task_output(task_io)
+            except BaseException as err:  # pragma: no cover
+                # Keep draining so the remaining buffers get closed,
+                # the error is raised from run() after the join
+                errors.append(err)
+
+    def _start_task_output_writer(self):
+        self._task_output_queue = queue.Queue()
+        self._task_output_errors = []
+
+        self._task_output_thread = threading.Thread(
+            target=self._task_output_writer,
+            args=(self._task_output_queue, self._task_output_errors),
+            daemon=True)
+
+        self._task_output_thread.start()
+
+    def _stop_task_output_writer(self):
+        # Returns the first error encountered while writing
+        # task output, or None if there was no error
+
+        output_queue = self._task_output_queue
+        output_thread = self._task_output_thread
+        errors = self._task_output_errors
+
+        self._task_output_queue = None
+        self._task_output_thread = None
+        self._task_output_errors = None
+
+        if output_thread is None:
+            return None
+
+        output_queue.put(None)
+        output_thread.join()
+
+        return errors[0] if errors else None
+
+    @staticmethod
+    def _dependent_chain_lengths(nodes):
+        # Takes a topologically sorted list of task nodes, and returns a dict
+        # mapping each node to the length of the longest chain of tasks above
+        # it which depend on it.  Tasks with the longest chains sit on the
+        # critical path, and should be run first when several are ready.
+
+        chain = dict.fromkeys(nodes, 0)
+
+        for node in reversed(nodes):
+            above = chain[node] + 1
+            for e in node.edges:
+                if chain.get(e, 0) < above:
+                    chain[e] = above
+
+        return chain
+
+    def _dispatch_parallel(self, jobs, task_graphs, submitted_futures):
+        # Submit each task to the threadpool as soon as all of its dependencies
+        # have finished, instead of blocking on the dependencies of one task
+        # at a time while other tasks may already be ready to run.
+        #
+        # At most 'jobs' tasks are handed to the threadpool at once, the rest of
+        # the ready tasks wait in a priority queue ordered by the length of the
+        # chain of tasks depending on them, longest first.  A task on the critical
+        # path that becomes ready late in the run can then still go ahead of
+        # less important tasks, instead of queueing behind them.
+        #
+        # Every submitted future is appended to submitted_futures in submission
+        # order, the caller waits on them and raises the first exception.
+
+        threadpool = self.threadpool
+
+        # Scheduled task nodes in topological order, how many unfinished
+        # dependencies each one is waiting on, and who depends on each of them
+        nodes = []
+        waiting_on = []
+        dependents = []
+
+        # Heap priority of each scheduled node
+        priority = []
+
+        # Maps scheduled nodes to their index, dependencies
+        # may have been scheduled by an earlier requested graph
+        node_index = dict()
+
+        # Heap of (-chain length, node index), the longest chain of dependents
+        # goes first, and the topological order breaks ties
+        ready = []
+
+        running = set()
+        future_index = dict()
+
+        def submit_ready():
+            while ready and len(running) < jobs:
+                index = heapq.heappop(ready)[1]
+                future = threadpool.submit(nodes[index].func)
+                future_index[future] = index
+                submitted_futures.append(future)
+                running.add(future)
+
+        # task_graphs is consumed lazily, the tasks of earlier graphs are
+        # already running while the later ones are being resolved
+
+        for graph in task_graphs:
+            graph = list(graph)
+            chain = Pake._dependent_chain_lengths(graph)
+
+            for node in graph:
+                if node is self._graph:
+                    continue
+
+                index = len(nodes)
+                nodes.append(node)
+                dependents.append([])
+
+                count = 0
+                for e in node.edges:
+                    dependency = node_index.get(e)
+                    if dependency is not None:
+                        dependents[dependency].append(index)
+                        count += 1
+
+                waiting_on.append(count)
+                node_index[node] = index
+                priority.append(-chain[node])
+
+                if count == 0:
+                    heapq.heappush(ready, (priority[index], index))
+
+            submit_ready()
+
+        while running:
+            done, running = futures_wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception():
+                    # Stop scheduling, the caller waits on everything
+                    # already submitted and raises the first exception
+                    return
+
+                for dependent in dependents[future_index[future]]:
+                    waiting_on[dependent] -= 1
+                    if waiting_on[dependent] == 0:
+                        heapq.heappush(ready, (priority[dependent], dependent))
+
+            submit_ready()
+
     def _run_parallel(self, jobs, task_graphs):
 
         # Task futures pending wait
@@ -2034,12 +2470,12 @@ class Pake:
             # is_running, and _threadool will be left 'None'
             # if constructing the threadpool throws
 
+            if self.sync_output:
+                self._start_task_output_writer()
+
             self._is_running = True
 
-            for graph in task_graphs:
-                for i in (i for i in graph if i is not self._graph):
-                    context = self.get_task_context(i.name)
-                    pending_futures.append(context._i_submit_self())
+            self._dispatch_parallel(jobs, task_graphs, pending_futures)
         finally:
             all_futures_waited = False
             try:
@@ -2057,11 +2493,19 @@ class Pake:
                 self._threadpool = None
                 self._is_running = False
 
-                if t_pool:
-                    # Only wait here if _wait_futures_and_raise did not finish.
-                    # this function will not complain if you have already waited
-                    # some of your threadpool tasks
-                    t_pool.shutdown(wait=not all_futures_waited)
+                try:
+                    if t_pool:
+                        # Only wait here if _wait_futures_and_raise did not finish.
+                        # this function will not complain if you have already waited
+                        # some of your threadpool tasks
+                        t_pool.shutdown(wait=not all_futures_waited)
+                finally:
+                    # Every task has handed off its output at this point,
+                    # wait for the writer to finish writing all of it
+                    output_error = self._stop_task_output_writer()
+
+                if output_error is not None and all_futures_waited:  # pragma: no cover
+                    raise output_error
 
     def _run_sync(self, graphs):
         try:
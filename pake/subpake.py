@@ -253,6 +253,7 @@ def _subpake_ignore_errors(args, stdout, silent, collect_output, collect_output_
         p_stdout = subprocess.DEVNULL
     else:
         p_stdout = stdout
+        stdout.flush()
 
     try:
         with subprocess.Popen(args,
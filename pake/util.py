@@ -26,8 +26,6 @@ import shlex
 import os
 from collections import namedtuple
 
-from os import path
-
 import pake.program
 
 __all__ = [
@@ -323,4 +321,4 @@ def is_more_recent(input, output):
 
     """
 
-    return path.getmtime(input) > path.getmtime(output)
+    return os.stat(input).st_mtime_ns > os.stat(output).st_mtime_ns
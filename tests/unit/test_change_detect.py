@@ -193,6 +193,84 @@ class GraphTest(unittest.TestCase):
 
         self.assertTrue(ran)
 
+        # ================
+
+        # Differing amount of inputs and outputs, every input
+        # is checked against every output
+
+        pake.de_init(clear_conf=False)
+        pk = pake.init()
+
+        ran = False
+
+        os.utime(in1, (0, 0))
+        os.utime(in2, (0, 0))
+        os.utime(out1, (0, 0))
+        os.utime(out2, (0, 0))
+
+        pake.FileHelper().touch(in1)
+
+        @pk.task(i=in1, o=[out1, out2])
+        def task_a(ctx):
+            nonlocal ran, self
+            ran = True
+            self.assertListEqual(ctx.outdated_inputs, [in1])
+            self.assertCountEqual(ctx.outdated_outputs, [out1, out2])
+
+        pk.run(tasks=task_a, jobs=jobs)
+
+        self.assertTrue(ran)
+
+        # ================
+
+        # Differing amount of inputs and outputs, only the pairs
+        # where the input is newer than the output are out of date
+
+        pake.de_init(clear_conf=False)
+        pk = pake.init()
+
+        ran = False
+
+        os.utime(in1, (100, 100))
+        os.utime(out1, (200, 200))
+        os.utime(in2, (300, 300))
+        os.utime(out2, (400, 400))
+
+        @pk.task(i=[in1, in2, in2], o=[out1, out2])
+        def task_a(ctx):
+            nonlocal ran, self
+            ran = True
+            self.assertListEqual(ctx.outdated_inputs, [in2])
+            self.assertListEqual(ctx.outdated_outputs, [out1])
+
+        pk.run(tasks=task_a, jobs=jobs)
+
+        self.assertTrue(ran)
+
+        os.utime(out1, (0, 0))
+        os.utime(out2, (0, 0))
+
+        # ================
+
+        # Nothing is out of date, multiple outputs
+
+        pake.de_init(clear_conf=False)
+        pk = pake.init()
+
+        ran = False
+
+        os.utime(in1, (0, 0))
+        os.utime(in2, (0, 0))
+
+        @pk.task(i=[in1, in2], o=[out1, out2])
+        def task_a(ctx):
+            nonlocal ran
+            ran = True
+
+        pk.run(tasks=task_a, jobs=jobs)
+
+        self.assertFalse(ran)
+
     def _exceptions_test(self, jobs):
         pake.de_init(clear_conf=False)
         pk = pake.init()
@@ -113,6 +113,52 @@ class GraphTest(unittest.TestCase):
         self.assertTrue(result == expect or result == or_expect,
                         msg='Topological sort on graph, unexpected result.')
 
+    def test_wide_sort(self):
+        # Many leaf dependencies can come in any order,
+        # but must all come before the node depending on them
+
+        root = pake.graph.Graph()
+        leaves = [pake.graph.Graph() for _ in range(100)]
+
+        for leaf in leaves:
+            root.add_edge(leaf)
+
+        result = list(root.topological_sort())
+
+        self.assertCountEqual(leaves, result[:-1])
+        self.assertIs(root, result[-1])
+
+    def test_shared_visited_sort(self):
+        # Sorting several nodes with the same visited set
+        # produces shared dependencies only once
+
+        a = pake.graph.Graph()
+        b = pake.graph.Graph()
+        shared = pake.graph.Graph()
+
+        a.add_edge(shared)
+        b.add_edge(shared)
+
+        visited = set()
+
+        self.assertListEqual([shared, a], list(a.topological_sort(visited)))
+        self.assertListEqual([b], list(b.topological_sort(visited)))
+        self.assertListEqual([], list(a.topological_sort(visited)))
+
+    def test_deep_sort(self):
+        # Very deep dependency chains should not be
+        # limited by the interpreter recursion limit
+
+        depth = sys.getrecursionlimit() * 2
+
+        nodes = [pake.graph.Graph() for _ in range(depth)]
+
+        for node, dependency in zip(nodes, nodes[1:]):
+            node.add_edge(dependency)
+
+        self.assertListEqual(list(reversed(nodes)), list(nodes[0].topological_sort()),
+                             msg='Topological sort on deep graph, unexpected result.')
+
 
 if __name__ == 'main':
     unittest.main()
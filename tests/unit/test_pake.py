@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 import unittest
 
 import os
@@ -327,3 +329,106 @@ class PakeTest(unittest.TestCase):
 
         self._is_running_exit_test(jobs=1,
                                    exit_method=lambda pk: pk.terminate(0))
+
+    def test_ready_tasks_not_blocked(self):
+
+        # Independent tasks should be submitted as soon as they are ready,
+        # not after the dependencies of tasks requested before them
+
+        pake.de_init(clear_conf=False)
+
+        pk = pake.init()
+
+        released = threading.Event()
+
+        @pk.task
+        def slow_dependency(ctx):
+            # Only finishes once the independent task has started
+            self.assertTrue(released.wait(timeout=10),
+                            msg='Independent task was not started while '
+                                'another task was waiting on its dependency.')
+
+        @pk.task(slow_dependency)
+        def task_a(ctx):
+            pass
+
+        @pk.task
+        def task_b(ctx):
+            released.set()
+
+        pk.run(tasks=[task_a, task_b], jobs=2)
+
+    def test_critical_path_first(self):
+
+        # Once a task on the longest dependency chain becomes ready,
+        # it should start before independent tasks with a shorter
+        # chain of dependents above them
+
+        pake.de_init(clear_conf=False)
+
+        pk = pake.init()
+
+        started = []
+        started_lock = threading.Lock()
+
+        def make_task(name, dependencies, duration):
+            def task(ctx):
+                with started_lock:
+                    started.append(name)
+                time.sleep(duration)
+
+            pk.add_task(name, task, dependencies=dependencies, show_header=False)
+            return name
+
+        c = make_task('C', None, 0)
+        b = make_task('B', c, 0)
+        a = make_task('A', b, 0)
+
+        leaves = [make_task('L{}'.format(i), None, 0.2) for i in range(0, 8)]
+
+        root = make_task('root', [a] + leaves, 0)
+
+        pk.run(tasks=root, jobs=2)
+
+        # C starts first, and B starts as soon as C finishes while
+        # the first leaf is still running, ahead of the other leaves
+        self.assertEqual('C', started[0])
+        self.assertEqual(2, started.index('B'))
+        self.assertEqual('root', started[-1])
+
+    def test_shared_dependency_runs_once(self):
+        for jobs in (1, 10):
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init()
+
+            shared_runs = 0
+
+            @pk.task
+            def shared(ctx):
+                nonlocal shared_runs
+                shared_runs += 1
+
+            @pk.task(shared)
+            def task_a(ctx):
+                pass
+
+            @pk.task(shared)
+            def task_b(ctx):
+                pass
+
+            pk.run(tasks=[task_a, task_b, shared], jobs=jobs)
+
+            self.assertEqual(shared_runs, 1)
+            self.assertEqual(pk.run_count, 3)
+
+    def test_pattern(self):
+        inputs = [os.path.join('src', 'a.c'), os.path.join('src', 'sub', 'b.cpp'), 'c.c']
+
+        self.assertListEqual(list(pake.pattern('obj/%.o')(inputs)),
+                             ['obj/a.o', 'obj/b.o', 'obj/c.o'])
+
+        self.assertListEqual(list(pake.pattern('{dir}/%{ext}.o')(inputs)),
+                             ['src/a.c.o',
+                              os.path.join('src', 'sub') + '/b.cpp.o',
+                              '/c.c.o'])
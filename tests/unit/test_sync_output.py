@@ -1,4 +1,6 @@
 import sys
+import tempfile
+import threading
 import unittest
 
 import os
@@ -14,6 +16,265 @@ import pake.pake
 
 class SyncOutputTest(unittest.TestCase):
 
+    def test_task_output_synchronized(self):
+        # All task output should be written by the time
+        # pake.Pake.run returns, and the output of each task
+        # should not be interleaved with that of other tasks
+
+        with tempfile.TemporaryFile(mode='w+') as pk_stdout:
+
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+            line_count = 50
+
+            def make_task(task_name):
+                def task(ctx):
+                    for i in range(0, line_count):
+                        ctx.print(task_name, i)
+
+                return pk.add_task(task_name, task, show_header=False)
+
+            tasks = [make_task('task_{}'.format(t)) for t in range(0, 20)]
+
+            pk.run(tasks=[t.name for t in tasks], jobs=10)
+
+            pk_stdout.seek(0)
+
+            lines = pk_stdout.read().splitlines()
+
+            self.assertEqual(len(lines), line_count * len(tasks))
+
+            for block_start in range(0, len(lines), line_count):
+                block = lines[block_start:block_start + line_count]
+                task_name = block[0].split()[0]
+
+                self.assertListEqual(block, ['{} {}'.format(task_name, i) for i in range(0, line_count)])
+
+    def test_task_output_with_subprocess(self):
+        self._task_output_with_subprocess_test(jobs=1)
+        self._task_output_with_subprocess_test(jobs=2)
+
+    def _task_output_with_subprocess_test(self, jobs):
+        # Output written to the task IO stream before and after
+        # a subprocess writes to it directly should stay in order
+
+        with tempfile.TemporaryFile(mode='w+') as pk_stdout:
+
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+            @pk.task(show_header=False)
+            def task_a(ctx):
+                ctx.print('before')
+                ctx.call(sys.executable, '-c', 'print("during")',
+                         ignore_errors=True, print_cmd=False)
+                ctx.print('after')
+
+            @pk.task(show_header=False)
+            def task_b(ctx):
+                ctx.print('only')
+
+            pk.run(tasks=[task_a, task_b], jobs=jobs)
+
+            pk_stdout.seek(0)
+
+            lines = pk_stdout.read().splitlines()
+
+            self.assertCountEqual(lines, ['before', 'during', 'after', 'only'])
+
+            lines.remove('only')
+
+            self.assertListEqual(lines, ['before', 'during', 'after'])
+
+    def test_task_output_buffer_spill(self):
+        # The output buffer moves its contents into a temporary
+        # file once the spill size is exceeded, without losing text
+
+        buffer = pake.pake._TaskOutputBuffer(spill_size=10)
+
+        try:
+            buffer.write('12345\n')
+            self.assertFalse(buffer._spilled)
+
+            buffer.write('678910\n')
+            self.assertTrue(buffer._spilled)
+
+            buffer.write('end\n')
+
+            buffer.seek(0)
+            self.assertEqual(buffer.read(), '12345\n678910\nend\n')
+        finally:
+            buffer.close()
+
+    def test_task_output_buffer_concurrent_spill(self):
+        # Writes from several threads must not be lost
+        # while the buffer moves into a temporary file
+
+        buffer = pake.pake._TaskOutputBuffer(spill_size=1000)
+
+        line_count = 5000
+
+        def writer(name):
+            for i in range(0, line_count):
+                buffer.write('{} {}\n'.format(name, i))
+
+        try:
+            threads = [threading.Thread(target=writer, args=(t,)) for t in range(0, 4)]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            self.assertTrue(buffer._spilled)
+
+            buffer.seek(0)
+            lines = buffer.read().splitlines()
+
+            self.assertCountEqual(lines, ['{} {}'.format(t, i)
+                                          for t in range(0, 4) for i in range(0, line_count)])
+        finally:
+            buffer.close()
+
+    def test_multitask_output_spill(self):
+        # Several subprocesses started from a multitask context write
+        # to the same task output, which moves into a temporary file
+        # part of the way through.  No output may be lost.
+
+        line_count = 2000
+
+        write_lines = 'for i in range({}): print({{}}, i)'.format(line_count)
+
+        original_spill_size = pake.pake._OUTPUT_BUFFER_SPILL_SIZE
+        pake.pake._OUTPUT_BUFFER_SPILL_SIZE = 1000
+
+        try:
+            with tempfile.TemporaryFile(mode='w+') as pk_stdout:
+
+                pake.de_init(clear_conf=False)
+
+                pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+                @pk.task(show_header=False)
+                def task_a(ctx):
+                    with ctx.multitask() as mt:
+                        for t in range(0, 4):
+                            mt.submit(ctx.call, sys.executable, '-c', write_lines.format(t),
+                                      print_cmd=False)
+
+                pk.run(tasks=task_a, jobs=4)
+
+                pk_stdout.seek(0)
+
+                lines = pk_stdout.read().splitlines()
+
+                self.assertCountEqual(lines, ['{} {}'.format(t, i)
+                                              for t in range(0, 4) for i in range(0, line_count)])
+        finally:
+            pake.pake._OUTPUT_BUFFER_SPILL_SIZE = original_spill_size
+
+    def test_failed_call_output(self):
+        # The output of a failing subprocess is kept for error reporting,
+        # and written to the task IO stream as it happens
+
+        with tempfile.TemporaryFile(mode='w+') as pk_stdout:
+
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+            @pk.task(show_header=False)
+            def task_a(ctx):
+                ctx.call(sys.executable, '-c', 'import sys; print("failing"); sys.exit(1)',
+                         print_cmd=False)
+
+            with self.assertRaises(pake.TaskException) as te:
+                pk.run(tasks=task_a, jobs=2)
+
+            subprocess_exception = te.exception.exception
+
+            self.assertEqual(type(subprocess_exception), pake.TaskSubprocessException)
+            self.assertEqual(subprocess_exception.output_stream.read(), 'failing\n')
+
+            pk_stdout.seek(0)
+
+            self.assertEqual(pk_stdout.read(), 'failing\n')
+
+    def test_call_output_newlines(self):
+        self._call_output_newlines_test(jobs=1)
+        self._call_output_newlines_test(jobs=2)
+
+    def _call_output_newlines_test(self, jobs):
+        # Windows line endings written by a subprocess are translated
+        # when output is collected, or kept for error reporting
+
+        write_crlf = 'import sys; sys.stdout.buffer.write(b"a\\r\\nb\\r\\n"); sys.exit({})'
+
+        with tempfile.TemporaryFile(mode='w+', newline='') as pk_stdout:
+
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+            failed_output = None
+
+            @pk.task(show_header=False)
+            def task_a(ctx):
+                nonlocal failed_output
+
+                ctx.call(sys.executable, '-c', write_crlf.format(0),
+                         collect_output=True, print_cmd=False)
+
+                try:
+                    ctx.call(sys.executable, '-c', write_crlf.format(1),
+                             silent=True, print_cmd=False)
+                except pake.TaskSubprocessException as err:
+                    failed_output = err.output_stream.read()
+
+            pk.run(tasks=task_a, jobs=jobs)
+
+            self.assertEqual(failed_output, 'a\nb\n')
+
+            pk_stdout.seek(0)
+
+            self.assertEqual(pk_stdout.read(), 'a\nb\n')
+
+    def test_silent_collect_output_command(self):
+        # With silent=True and collect_output=True the command line
+        # only goes into the output kept for error reporting, nothing
+        # is written to the task output
+
+        with tempfile.TemporaryFile(mode='w+') as pk_stdout:
+
+            pake.de_init(clear_conf=False)
+
+            pk = pake.init(stdout=pk_stdout, sync_output=True)
+
+            command = [sys.executable, '-c', 'import sys; print("out"); sys.exit(1)']
+
+            failed_output = None
+
+            @pk.task(show_header=False)
+            def task_a(ctx):
+                nonlocal failed_output
+
+                try:
+                    ctx.call(command, silent=True, collect_output=True, print_cmd=True)
+                except pake.TaskSubprocessException as err:
+                    failed_output = err.output_stream.read()
+
+            pk.run(tasks=task_a, jobs=2)
+
+            self.assertEqual(failed_output, ' '.join(command) + '\nout\n')
+
+            pk_stdout.seek(0)
+
+            self.assertEqual(pk_stdout.read(), '')
+
     def test_specify_sync_output(self):
         # This test just makes sure the --sync-output
         # is correctly setting pake.Pake.sync_output
@@ -24,3 +24,21 @@ class TaskGraphTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             # Because func is not callable
             _ = pake.TaskGraph('name', 1)
+
+    def test_dependent_chain_lengths(self):
+        # a depends on b and leaf, b depends on c.
+        # c is at the bottom of the longest chain of
+        # dependents, leaf only has a above it
+
+        a = pake.TaskGraph('a', lambda: None)
+        b = pake.TaskGraph('b', lambda: None)
+        c = pake.TaskGraph('c', lambda: None)
+        leaf = pake.TaskGraph('leaf', lambda: None)
+
+        a.add_edge(leaf)
+        a.add_edge(b)
+        b.add_edge(c)
+
+        chain = pake.Pake._dependent_chain_lengths(list(a.topological_sort()))
+
+        self.assertDictEqual({a: 0, b: 1, c: 2, leaf: 1}, chain)
@@ -251,4 +251,23 @@ class UtilTest(unittest.TestCase):
 
         self.assertEqual(caller_detail, None)
 
+    def test_is_more_recent(self):
+        in1 = os.path.join(script_dir, 'test_data', 'in1')
+        out1 = os.path.join(script_dir, 'test_data', 'out1')
 
+        # A realistic timestamp, where float seconds can
+        # not represent a difference of one nanosecond
+
+        mtime = 1700000000 * 10 ** 9
+
+        os.utime(in1, ns=(mtime, mtime))
+        os.utime(out1, ns=(mtime, mtime))
+
+        self.assertFalse(pake.util.is_more_recent(in1, out1))
+
+        # A one nanosecond difference in modification time should be detected
+
+        os.utime(in1, ns=(mtime, mtime + 1))
+
+        self.assertTrue(pake.util.is_more_recent(in1, out1))
+        self.assertFalse(pake.util.is_more_recent(out1, in1))